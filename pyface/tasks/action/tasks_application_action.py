@@ -38,6 +38,6 @@ class CreateTaskWindowAction(TasksApplicationAction):
             layout = self.application.default_layout[0]
         else:
             layout = TaskWindowLayout()
-            if self.task_factories:
-                layout.items = [self.task_factories[0].id]
+            if self.application.task_factories:
+                layout.items = [self.application.task_factories[0].id]
         return layout
@@ -12,42 +12,76 @@ the creation of tasks and corresponding windows.
 """
 
 
-from functools import partial
 import logging
 
 from traits.api import (
     Callable,
-    HasStrictTraits,
     List,
     Instance,
     Property,
-    Str,
     cached_property,
     observe,
 )
 
+from pyface.action.api import (
+    AboutAction,
+    CloseActiveWindowAction,
+    ExitAction,
+)
 from pyface.gui_application import GUIApplication
+from pyface.tasks.action.schema import SMenu
+from pyface.tasks.action.schema_addition import SchemaAddition
+from pyface.tasks.action.task_window_toggle_group import TaskWindowToggleGroup
+from pyface.tasks.task import Task
+from pyface.tasks.task_window import TaskWindow
+from pyface.tasks.task_window_layout import TaskWindowLayout
 
 logger = logging.getLogger(__name__)
 
 
-class TaskFactory(HasStrictTraits):
+class _ApplicationBoundFactory(object):
+    """ A factory for an action class bound to an application.
+
+    This is a lightweight replacement for a functools.partial binding
+    ``application``: it is slotted, so it is smaller, and its call does not
+    have to walk stored positional arguments.
+    """
+
+    __slots__ = ("cls", "application", "kwargs")
+
+    def __init__(self, cls, application, **kwargs):
+        self.cls = cls
+        self.application = application
+        self.kwargs = kwargs
+
+    def __call__(self):
+        return self.cls(application=self.application, **self.kwargs)
+
+
+class TaskFactory(object):
     """ A factory for creating a Task with some additional metadata.
+
+    Task factories are plain classes rather than HasTraits subclasses:
+    their attributes are fixed once the factory is registered and nothing
+    observes them, so the notification machinery would be pure overhead.
     """
 
-    #: The task factory's unique identifier. This ID is assigned to all tasks
-    #: created by the factory.
-    id = Str()
+    __slots__ = ("id", "name", "factory")
 
-    #: The task factory's user-visible name.
-    name = Str()
+    def __init__(self, id="", name="", factory=None):
+        #: The task factory's unique identifier. This ID is assigned to all
+        #: tasks created by the factory.
+        self.id = id
 
-    #: A callable with the following signature:
-    #:
-    #:     callable(\**traits) -> Task
-    #:
-    #: Often this attribute will simply be a Task subclass.
-    factory = Callable
+        #: The task factory's user-visible name.
+        self.name = name
+
+        #: A callable with the following signature:
+        #:
+        #:     callable(\**traits) -> Task
+        #:
+        #: Often this attribute will simply be a Task subclass.
+        self.factory = factory
 
     def create(self, **traits):
         """ Creates the Task.
@@ -68,7 +102,7 @@ class TasksApplication(GUIApplication):
     # Task management --------------------------------------------------------
 
     #: List of all running tasks
-    tasks = List(Instance("pyface.tasks.task.Task"))
+    tasks = List(Instance(Task))
 
     #: Currently active Task if any.
     active_task = Property(observe="active_window.active_task")
@@ -76,20 +110,32 @@ class TasksApplication(GUIApplication):
     #: List of all application task factories.
     task_factories = List()
 
-    #: The default layout for the application. If not specified, a single
+    #: The default layout for the application. If left empty, a single
     #: window will be created with the first available task factory.
-    default_layout = List(
-        Instance("pyface.tasks.task_window_layout.TaskWindowLayout")
-    )
+    default_layout = List(Instance(TaskWindowLayout))
 
     #: Hook to add global schema additions to tasks/windows
-    extra_actions = List(
-        Instance("pyface.tasks.action.schema_addition.SchemaAddition")
-    )
+    extra_actions = List(Instance(SchemaAddition))
 
     #: Hook to add global dock pane additions to tasks/windows
     extra_dock_pane_factories = List(Callable)
 
+    # Private traits ---------------------------------------------------------
+
+    #: Mapping from task factory ID to factory, for fast factory lookup.
+    _factory_by_id = Property(observe="task_factories.items")
+
+    #: The running tasks as a set, for fast membership testing.
+    _tasks_set = Property(observe="tasks.items")
+
+    #: Frozen snapshots of the extra actions and dock pane factories, so
+    #: that create_task iterates plain tuples rather than trait lists.
+    _extra_actions_snapshot = Property(observe="extra_actions.items")
+
+    _extra_dock_pane_factories_snapshot = Property(
+        observe="extra_dock_pane_factories.items"
+    )
+
     # Window lifecycle methods -----------------------------------------------
 
     def create_task(self, id):
@@ -106,21 +152,21 @@ class TasksApplication(GUIApplication):
         """
         factory = self._get_task_factory(id)
         if factory is None:
-            logger.warning("Could not find task factory {}".format(id))
+            logger.warning("Could not find task factory %s", id)
             return None
 
-        task = factory.create(id=factory.id)
-        task.extra_actions.extend(self.extra_actions)
-        task.extra_dock_pane_factories.extend(self.extra_dock_pane_factories)
-        return task
+        return self._create_task_from_factory(factory)
 
-    def create_window(self, layout=None, **kwargs):
+    def create_window(self, layout=None, tasks=None, **kwargs):
         """ Connect task to application and open task in a new window.
 
         Parameters
         ----------
         layout : TaskLayout instance or None
             The pane layout for the window.
+        tasks : list of Task instances or None
+            Tasks to add to the window. If not provided, the tasks are
+            created from the task IDs in the layout.
         **kwargs : dict
             Additional keyword arguments to pass to the window factory.
 
@@ -130,31 +176,35 @@ class TasksApplication(GUIApplication):
         window : ITaskWindow instance or None
             The new TaskWindow.
         """
-        from pyface.tasks.task_window_layout import TaskWindowLayout
-
         window = super(TasksApplication, self).create_window(**kwargs)
 
         if layout is not None:
-            for task_id in layout.get_tasks():
-                task = self.create_task(task_id)
-                if task is not None:
-                    window.add_task(task)
-                else:
-                    msg = "Missing factory for task with ID %r"
-                    logger.error(msg, task_id)
-        else:
-            # Create an empty layout to set default size and position only
-            layout = TaskWindowLayout()
-
-        window.set_window_layout(layout)
+            if tasks is None:
+                tasks = self._create_tasks_for_layout(layout)
+            for task in tasks:
+                window.add_task(task)
+            window.set_window_layout(layout)
+        # When no layout is given the window keeps the position, size and
+        # size state declared by the toolkit window, so no empty layout
+        # needs to be built and applied.
 
         return window
 
     def _create_windows(self):
         """ Create the initial windows to display from the default layout.
         """
-        for layout in self.default_layout:
-            window = self.create_window(layout)
+        default_layout = self.default_layout
+        if not default_layout:
+            # Show a single window with the first task factory, without
+            # storing the fallback layout on the trait.
+            window_layout = TaskWindowLayout()
+            if self.task_factories:
+                window_layout.items = [self.task_factories[0].id]
+            default_layout = [window_layout]
+
+        for layout in default_layout:
+            tasks = self._create_tasks_for_layout(layout)
+            window = self.create_window(layout, tasks=tasks)
             self.add_window(window)
             self.active_window = window
 
@@ -162,13 +212,44 @@ class TasksApplication(GUIApplication):
         # Private interface
         # -------------------------------------------------------------------------
 
+    def _create_tasks_for_layout(self, layout):
+        """ Creates the tasks referenced by a window layout, logging an
+        error for any task ID without a factory.
+        """
+        tasks = []
+        for task_id in layout.get_tasks():
+            task = self.create_task(task_id)
+            if task is not None:
+                tasks.append(task)
+            else:
+                msg = "Missing factory for task with ID %r"
+                logger.error(msg, task_id)
+        return tasks
+
+    def _create_task_from_factory(self, factory):
+        """ Creates a Task from the given factory and adds the application's
+        extra actions and dock pane factories to it.
+        """
+        task = factory.create(id=factory.id)
+        # Rebind rather than extend so that at most a single change
+        # notification is fired per list, and fire none at all when the
+        # application contributes nothing.
+        extra_actions = self._extra_actions_snapshot
+        if extra_actions:
+            task.extra_actions = list(task.extra_actions) + list(
+                extra_actions
+            )
+        extra_dock_pane_factories = self._extra_dock_pane_factories_snapshot
+        if extra_dock_pane_factories:
+            task.extra_dock_pane_factories = list(
+                task.extra_dock_pane_factories
+            ) + list(extra_dock_pane_factories)
+        return task
+
     def _get_task_factory(self, id):
         """ Returns the TaskFactory with the specified ID, or None.
         """
-        for factory in self.task_factories:
-            if factory.id == id:
-                return factory
-        return None
+        return self._factory_by_id.get(id)
 
     # Destruction utilities ---------------------------------------------------
 
@@ -177,8 +258,10 @@ class TasksApplication(GUIApplication):
         """ Listener that ensures window handles are released when closed.
         """
         window = event.object
-        if getattr(window, "active_task", None) in self.tasks:
-            self.tasks.remove(window.active_task)
+        # The getattr guards against windows which are not TaskWindows.
+        task = getattr(window, "active_task", None)
+        if task in self._tasks_set:
+            self.tasks.remove(task)
         super(TasksApplication, self)._on_window_closed(event)
 
     # Trait initializers and property getters ---------------------------------
@@ -189,18 +272,8 @@ class TasksApplication(GUIApplication):
         This will be sufficient in many cases as customized behaviour comes
         from the Task and the TaskWindow is just a shell.
         """
-        from pyface.tasks.task_window import TaskWindow
-
         return TaskWindow
 
-    def _default_layout_default(self):
-        from pyface.tasks.task_window_layout import TaskWindowLayout
-
-        window_layout = TaskWindowLayout()
-        if self.task_factories:
-            window_layout.items = [self.task_factories[0].id]
-        return [window_layout]
-
     def _extra_actions_default(self):
         """ Extra application-wide menu items
 
@@ -212,35 +285,29 @@ class TasksApplication(GUIApplication):
         so that Ctrl-N and Ctrl-W will be bound to creating/closing new editors
         rather than new task windows.
         """
-        from pyface.action.api import (
-            AboutAction,
-            CloseActiveWindowAction,
-            ExitAction,
-        )
-        from pyface.tasks.action.api import (
+        # Imported here to avoid a circular import: the module defining
+        # CreateTaskWindowAction imports this one.
+        from pyface.tasks.action.tasks_application_action import (
             CreateTaskWindowAction,
-            SchemaAddition,
-            SMenu,
-            TaskWindowToggleGroup,
         )
 
         return [
             SchemaAddition(
-                factory=CreateTaskWindowAction.factory(
-                    application=self, accelerator="Ctrl+Shift+N"
+                factory=_ApplicationBoundFactory(
+                    CreateTaskWindowAction, self, accelerator="Ctrl+Shift+N"
                 ),
                 path="MenuBar/File/new_group",
             ),
             SchemaAddition(
                 id="close_action",
-                factory=CloseActiveWindowAction.factory(
-                    application=self, accelerator="Ctrl+Shift+W"
+                factory=_ApplicationBoundFactory(
+                    CloseActiveWindowAction, self, accelerator="Ctrl+Shift+W"
                 ),
                 path="MenuBar/File/close_group",
             ),
             SchemaAddition(
                 id="exit_action",
-                factory=ExitAction.factory(application=self),
+                factory=_ApplicationBoundFactory(ExitAction, self),
                 path="MenuBar/File/close_group",
                 absolute_position="last",
             ),
@@ -257,12 +324,33 @@ class TasksApplication(GUIApplication):
             ),
             SchemaAddition(
                 id="about_action",
-                factory=AboutAction.factory(application=self),
+                factory=_ApplicationBoundFactory(AboutAction, self),
                 path="MenuBar/Help",
                 absolute_position="first",
             ),
         ]
 
+    @cached_property
+    def _get__factory_by_id(self):
+        # As with the linear scan this index replaces, the first factory
+        # registered with a given ID wins.
+        factory_by_id = {}
+        for factory in self.task_factories:
+            factory_by_id.setdefault(factory.id, factory)
+        return factory_by_id
+
+    @cached_property
+    def _get__tasks_set(self):
+        return set(self.tasks)
+
+    @cached_property
+    def _get__extra_actions_snapshot(self):
+        return tuple(self.extra_actions)
+
+    @cached_property
+    def _get__extra_dock_pane_factories_snapshot(self):
+        return tuple(self.extra_dock_pane_factories)
+
     @cached_property
     def _get_active_task(self):
         if self.active_window is not None:
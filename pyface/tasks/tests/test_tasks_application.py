@@ -10,13 +10,17 @@
 
 
 import unittest
+from unittest import mock
 
 from traits.api import Bool
 
 from pyface.application_window import ApplicationWindow
+from pyface.tasks.action.schema_addition import SchemaAddition
+from pyface.tasks.task import Task
+from pyface.tasks.task_window_layout import TaskWindowLayout
 from pyface.toolkit import toolkit_object
 
-from ..tasks_application import TasksApplication
+from ..tasks_application import TaskFactory, TasksApplication
 
 GuiTestAssistant = toolkit_object("util.gui_test_assistant:GuiTestAssistant")
 no_gui_test_assistant = GuiTestAssistant.__name__ == "Unimplemented"
@@ -93,6 +97,177 @@ class TestingApp(TasksApplication):
         super(TestingApp, self)._prepare_exit()
 
 
+def mock_window():
+    """ A stand-in for a TaskWindow, usable without a real toolkit. """
+    window = mock.Mock()
+    window.size = (-1, -1)
+    window.title = ""
+    return window
+
+
+class TestTaskFactory(unittest.TestCase):
+    def test_defaults(self):
+        factory = TaskFactory()
+
+        self.assertEqual(factory.id, "")
+        self.assertEqual(factory.name, "")
+        self.assertIsNone(factory.factory)
+
+    def test_construction(self):
+        factory = TaskFactory(id="a", name="A Task", factory=Task)
+
+        self.assertEqual(factory.id, "a")
+        self.assertEqual(factory.name, "A Task")
+        self.assertIs(factory.factory, Task)
+
+    def test_create(self):
+        factory = TaskFactory(id="a", factory=Task)
+
+        task = factory.create(id=factory.id)
+
+        self.assertIsInstance(task, Task)
+        self.assertEqual(task.id, "a")
+
+
+class TestTasksApplication(unittest.TestCase):
+    """ Tests for TasksApplication behaviour that needs no real windows. """
+
+    def test_get_task_factory(self):
+        factory = TaskFactory(id="a", factory=Task)
+        app = TasksApplication(task_factories=[factory])
+
+        self.assertIs(app._get_task_factory("a"), factory)
+        self.assertIsNone(app._get_task_factory("b"))
+
+    def test_get_task_factory_after_append(self):
+        app = TasksApplication(
+            task_factories=[TaskFactory(id="a", factory=Task)]
+        )
+        self.assertIsNone(app._get_task_factory("b"))
+
+        factory = TaskFactory(id="b", factory=Task)
+        app.task_factories.append(factory)
+
+        self.assertIs(app._get_task_factory("b"), factory)
+
+    def test_get_task_factory_after_reassignment(self):
+        app = TasksApplication(
+            task_factories=[TaskFactory(id="a", factory=Task)]
+        )
+        self.assertIsNotNone(app._get_task_factory("a"))
+
+        factory = TaskFactory(id="b", factory=Task)
+        app.task_factories = [factory]
+
+        self.assertIsNone(app._get_task_factory("a"))
+        self.assertIs(app._get_task_factory("b"), factory)
+
+    def test_get_task_factory_duplicate_ids(self):
+        # The first factory registered with an ID wins, as it did when
+        # factories were resolved by a linear scan.
+        first = TaskFactory(id="a", factory=Task)
+        app = TasksApplication(
+            task_factories=[first, TaskFactory(id="a", factory=Task)]
+        )
+
+        self.assertIs(app._get_task_factory("a"), first)
+
+    def test_create_task_extra_actions_updated(self):
+        app = TasksApplication(
+            task_factories=[TaskFactory(id="a", factory=Task)],
+            extra_actions=[],
+        )
+        self.assertEqual(app.create_task("a").extra_actions, [])
+
+        addition = SchemaAddition(
+            id="extra", factory=lambda: None, path="MenuBar"
+        )
+        app.extra_actions.append(addition)
+
+        self.assertEqual(app.create_task("a").extra_actions, [addition])
+
+    def test_create_task_extra_dock_pane_factories_updated(self):
+        app = TasksApplication(
+            task_factories=[TaskFactory(id="a", factory=Task)]
+        )
+        self.assertEqual(app.create_task("a").extra_dock_pane_factories, [])
+
+        def dock_pane_factory():
+            pass
+
+        app.extra_dock_pane_factories = [dock_pane_factory]
+
+        self.assertEqual(
+            app.create_task("a").extra_dock_pane_factories,
+            [dock_pane_factory],
+        )
+
+    def test_create_window_with_precreated_tasks(self):
+        app = TasksApplication(
+            task_factories=[TaskFactory(id="a", factory=Task)]
+        )
+        window = mock_window()
+        app.window_factory = lambda **kwargs: window
+        task = app.create_task("a")
+        layout = TaskWindowLayout(items=["a"])
+
+        result = app.create_window(layout, tasks=[task])
+
+        self.assertIs(result, window)
+        window.add_task.assert_called_once_with(task)
+        window.set_window_layout.assert_called_once_with(layout)
+
+    def test_create_window_creates_tasks_from_layout(self):
+        app = TasksApplication(
+            task_factories=[TaskFactory(id="a", factory=Task)]
+        )
+        window = mock_window()
+        app.window_factory = lambda **kwargs: window
+        layout = TaskWindowLayout(items=["a"])
+
+        app.create_window(layout)
+
+        self.assertEqual(window.add_task.call_count, 1)
+        task = window.add_task.call_args[0][0]
+        self.assertEqual(task.id, "a")
+        window.set_window_layout.assert_called_once_with(layout)
+
+    def test_create_window_missing_factory(self):
+        app = TasksApplication(
+            task_factories=[TaskFactory(id="a", factory=Task)]
+        )
+        window = mock_window()
+        app.window_factory = lambda **kwargs: window
+        layout = TaskWindowLayout(items=["a", "missing"])
+
+        with self.assertLogs(
+            "pyface.tasks.tasks_application", level="ERROR"
+        ) as log_context:
+            app.create_window(layout)
+
+        self.assertEqual(window.add_task.call_count, 1)
+        self.assertIn("'missing'", log_context.output[0])
+
+    def test_create_window_uses_create_task_hook(self):
+        # Tasks for a layout are created through create_task, so subclasses
+        # overriding it still take effect.
+        marker_task = Task(id="a")
+
+        class HookedApplication(TasksApplication):
+            def create_task(self, id):
+                return marker_task
+
+        app = HookedApplication(
+            task_factories=[TaskFactory(id="a", factory=Task)]
+        )
+        window = mock_window()
+        app.window_factory = lambda **kwargs: window
+
+        app.create_window(TaskWindowLayout(items=["a"]))
+
+        window.add_task.assert_called_once_with(marker_task)
+
+
 @unittest.skipIf(no_gui_test_assistant, "No GuiTestAssistant")
 class TestApplication(unittest.TestCase, GuiTestAssistant):
     def setUp(self):
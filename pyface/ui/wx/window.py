@@ -14,7 +14,15 @@
 import wx
 
 
-from traits.api import Event, Property, Tuple, Str, VetoableEvent, provides
+from traits.api import (
+    Enum,
+    Event,
+    Property,
+    Tuple,
+    Str,
+    VetoableEvent,
+    provides,
+)
 
 
 from pyface.i_window import IWindow, MWindow
@@ -35,6 +43,8 @@ class Window(MWindow, Widget):
 
     size = Property(Tuple)
 
+    size_state = Enum("normal", "maximized")
+
     title = Str()
 
     # Window Events ----------------------------------------------------------